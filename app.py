@@ -6,6 +6,7 @@ from fastapi.templating import Jinja2Templates
 from starlette.responses import HTMLResponse, RedirectResponse
 from uvicorn import run as app_run
 
+import asyncio
 from typing import Optional
 
 # Importing constants and pipeline modules from the project
@@ -22,6 +23,10 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Set up Jinja2 template engine for rendering HTML templates
 templates = Jinja2Templates(directory='templates')
 
+# Training runs of this process share one artifact directory (same run timestamp and configs),
+# so only one may run at a time; later /train requests wait for the current run to finish
+training_lock = asyncio.Lock()
+
 # Allow all origins for Cross-Origin Resource Sharing (CORS)
 origins = ["*"]
 
@@ -88,8 +93,9 @@ async def trainRouteClient():
     Endpoint to initiate the model training pipeline.
     """
     try:
-        train_pipeline = TrainPipeline()
-        train_pipeline.run_pipeline()
+        async with training_lock:
+            train_pipeline = TrainPipeline()
+            await train_pipeline.run_pipeline_async()
         return Response("Training successful!!!")
 
     except Exception as e:
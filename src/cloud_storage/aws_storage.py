@@ -1,6 +1,6 @@
 import boto3
 from src.configuration.aws_connection import S3Client
-from io import StringIO
+from io import BytesIO, StringIO
 from typing import Union,List
 import os,sys
 from src.logger import logging
@@ -39,7 +39,8 @@ class SimpleStorageService:
         """
         try:
             bucket = self.get_bucket(bucket_name)
-            file_objects = [file_object for file_object in bucket.objects.filter(Prefix=s3_key)]
+            # One matching key is enough, so stop after the first listed object
+            file_objects = [file_object for file_object in bucket.objects.filter(Prefix=s3_key).limit(1)]
             return len(file_objects) > 0
         except Exception as e:
             raise MyException(e, sys)
@@ -114,6 +115,7 @@ class SimpleStorageService:
     def load_model(self, model_name: str, bucket_name: str, model_dir: str = None) -> object:
         """
         Loads a serialized model from the specified S3 bucket.
+        The object is fetched by key into memory, without listing the bucket first.
 
         Args:
             model_name (str): Name of the model file in the bucket.
@@ -125,9 +127,9 @@ class SimpleStorageService:
         """
         try:
             model_file = model_dir + "/" + model_name if model_dir else model_name
-            file_object = self.get_file_object(model_file, bucket_name)
-            model_obj = self.read_object(file_object, decode=False)
-            model = pickle.loads(model_obj)
+            model_obj = BytesIO()
+            self.s3_client.download_fileobj(bucket_name, model_file, model_obj)
+            model = pickle.loads(model_obj.getbuffer())
             logging.info("Production model loaded from S3 bucket.")
             return model
         except Exception as e:
@@ -164,14 +166,14 @@ class SimpleStorageService:
         """
         logging.info("Entered the upload_file method of SimpleStorageService class")
         try:
-            logging.info(f"Uploading {from_filename} to {to_filename} in {bucket_name}")
+            logging.info("Uploading %s to %s in %s", from_filename, to_filename, bucket_name)
             self.s3_resource.meta.client.upload_file(from_filename, bucket_name, to_filename)
-            logging.info(f"Uploaded {from_filename} to {to_filename} in {bucket_name}")
+            logging.info("Uploaded %s to %s in %s", from_filename, to_filename, bucket_name)
 
             # Delete the local file if remove is True
             if remove:
                 os.remove(from_filename)
-                logging.info(f"Removed local file {from_filename} after upload")
+                logging.info("Removed local file %s after upload", from_filename)
             logging.info("Exited the upload_file method of SimpleStorageService class")
         except Exception as e:
             raise MyException(e, sys) from e
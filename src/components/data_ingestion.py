@@ -1,8 +1,14 @@
 import os  # To handle file paths and directories
 import sys  # To pass system info to exception handler
-
+import shutil  # To copy feature store files to and from the cache
+from concurrent.futures import Future, ThreadPoolExecutor  # To write files in the background
+from typing import Optional  # For the optional config argument
+
+import numpy as np  # To build the random train/test mask
+import pandas as pd  # To read cached feature store files
+import pyarrow as pa  # To convert train/test splits to Arrow tables
+import pyarrow.feather as feather  # To write train/test splits as Feather files
 from pandas import DataFrame  # To work with data as DataFrames
-from sklearn.model_selection import train_test_split  # To split dataset into train/test
 
 # Import your project's specific modules:
 from src.entity.config_entity import DataIngestionConfig  # Config dataclass for ingestion settings
@@ -10,17 +16,19 @@ from src.entity.artifact_entity import DataIngestionArtifact  # Artifact datacla
 from src.exception import MyException  # Custom exception class for consistent error handling
 from src.logger import logging  # Custom logger for info/debug messages
 from src.data_access.proj1_data import Proj1Data  # Class to interface with MongoDB data
+from src.utils.main_utils import optimize_dtypes  # To downcast dtypes of cached feature store / split data
 
 
 class DataIngestion:
-    def __init__(self, data_ingestion_config: DataIngestionConfig = DataIngestionConfig()):
+    def __init__(self, data_ingestion_config: Optional[DataIngestionConfig] = None):
         """
         Initialize DataIngestion with configuration settings.
 
         Parameters:
         ----------
-        data_ingestion_config: DataIngestionConfig
+        data_ingestion_config: Optional[DataIngestionConfig]
             Contains settings like collection name, file paths, and train-test split ratio.
+            Defaults to DataIngestionConfig(), built here rather than at import time.
 
         Purpose:
         --------
@@ -28,22 +36,29 @@ class DataIngestion:
         Wrap in try-except to catch config initialization errors.
         """
         try:
-            self.data_ingestion_config = data_ingestion_config  # Save config
+            self.data_ingestion_config = data_ingestion_config or DataIngestionConfig()  # Save config
+            # A single writer thread runs file writes in submission order, off the pipeline's critical path
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data_ingestion_writer")
+            # Feature store / cache copies nobody downstream reads; submitted after the train/test write
+            self._deferred_copies: list[tuple] = []
         except Exception as e:
             # If something goes wrong, raise a custom exception passing sys for traceback info
             raise MyException(e, sys)
 
     def export_data_into_feature_store(self) -> DataFrame:
         """
-        Export MongoDB collection data to a CSV file acting as feature store.
+        Export MongoDB collection data to a Parquet file acting as feature store.
 
         Steps:
         ------
         1. Log start of export process.
-        2. Use Proj1Data class to fetch collection data as DataFrame.
-        3. Log shape of fetched data (rows, columns).
-        4. Ensure the directory for the CSV file exists (create if not).
-        5. Save the DataFrame as CSV to the specified feature store file path.
+        2. Fingerprint the collection; on a cache hit read the cached Parquet file without
+           scanning MongoDB; it is copied into the feature store later, in the background.
+        3. Otherwise use Proj1Data class to fetch collection data as DataFrame,
+           streaming each fetched batch into the feature store Parquet file.
+        4. Log shape of fetched data (rows, columns).
+        5. Keep a copy of the feature store file in the cache under its fingerprint (later, in the background).
+        Copies are only queued here; initiate_data_ingestion submits them behind the train/test write.
         6. Return the DataFrame for further processing.
 
         Raises:
@@ -51,19 +66,12 @@ class DataIngestion:
         MyException if any step fails.
         """
         try:
-            logging.info(f"Exporting data from mongodb")  # Log info for traceability
+            logging.info("Exporting data from mongodb")  # Log info for traceability
 
             # Create Proj1Data object to interact with MongoDB
             my_data = Proj1Data()
 
-            # Call method to export entire collection as DataFrame
-            dataframe = my_data.export_collection_as_dataframe(
-                collection_name=self.data_ingestion_config.collection_name
-            )
-
-            logging.info(f"Shape of dataframe: {dataframe.shape}")  # Log rows and cols count
-
-            # Extract the configured path to save CSV file (feature store)
+            # Extract the configured path to save Parquet file (feature store)
             feature_store_file_path = self.data_ingestion_config.feature_store_file_path
 
             # Get directory path part from the file path
@@ -72,10 +80,31 @@ class DataIngestion:
             # Make sure directory exists; if not, create it recursively
             os.makedirs(dir_path, exist_ok=True)
 
-            logging.info(f"Saving exported data into feature store file path: {feature_store_file_path}")
+            # A metadata-only round-trip tells us whether a previous run already exported this data
+            fingerprint = my_data.get_collection_fingerprint(
+                collection_name=self.data_ingestion_config.collection_name
+            )
+            cache_dir = self.data_ingestion_config.feature_store_cache_dir
+            cached_file_path = os.path.join(cache_dir, f"{fingerprint}.parquet")
+
+            if os.path.exists(cached_file_path):
+                logging.info("Feature store cache hit, copying %s to %s", cached_file_path, feature_store_file_path)
+                self._deferred_copies.append((shutil.copyfile, cached_file_path, feature_store_file_path))
+                return optimize_dtypes(pd.read_parquet(cached_file_path))
 
-            # Save DataFrame to CSV, excluding row indices, including header row
-            dataframe.to_csv(feature_store_file_path, index=False, header=True)
+            logging.info("Saving exported data into feature store file path: %s", feature_store_file_path)
+
+            # Export entire collection as DataFrame; batches are written to the feature store
+            # as they arrive, overlapping the MongoDB reads with the Parquet writes
+            dataframe = my_data.export_collection_as_dataframe(
+                collection_name=self.data_ingestion_config.collection_name,
+                file_path=feature_store_file_path
+            )
+
+            logging.info("Shape of dataframe: %s", dataframe.shape)  # Log rows and cols count
+
+            # Populate the cache in the background
+            self._deferred_copies.append((self._populate_cache, feature_store_file_path, cached_file_path))
 
             return dataframe  # Return the data for use in later steps
 
@@ -83,9 +112,95 @@ class DataIngestion:
             # Wrap exceptions in custom error class with sys info for stack trace
             raise MyException(e, sys)
 
-    def split_data_as_train_test(self, dataframe: DataFrame) -> None:
+    def _submit_deferred_copies(self) -> None:
+        """
+        Queue the feature store / cache copies on the writer thread, behind any train/test write.
+        Later stages never read these files, so a failed copy is only logged.
+        """
+        for copy_function, *paths in self._deferred_copies:
+            self._writer.submit(copy_function, *paths).add_done_callback(self._log_copy_failure)
+        self._deferred_copies.clear()
+
+    @staticmethod
+    def _log_copy_failure(copy: Future) -> None:
         """
-        Split the given DataFrame into training and testing datasets, and save as CSV.
+        Done-callback of a deferred copy: logs its error, if any.
+        """
+        if copy.exception() is not None:
+            logging.warning("Background feature store copy failed: %s", copy.exception())
+
+    @staticmethod
+    def _populate_cache(feature_store_file_path: str, cached_file_path: str) -> None:
+        """
+        Copy the feature store file into the cache.
+        Copy then rename so a crash never leaves a partial cache file behind.
+        """
+        try:
+            os.makedirs(os.path.dirname(cached_file_path), exist_ok=True)
+            shutil.copyfile(feature_store_file_path, f"{cached_file_path}.tmp")
+            os.replace(f"{cached_file_path}.tmp", cached_file_path)
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    @staticmethod
+    def _write_feather(data: DataFrame, file_path: str) -> None:
+        """
+        Save a train/test split as uncompressed Feather without index.
+        """
+        feather.write_feather(pa.Table.from_pandas(data, preserve_index=False), file_path, compression="uncompressed")
+
+    def _optimize_split_dtypes(self) -> None:
+        """
+        Rewrite the train/test files of the server-side split with the dtypes the in-memory path
+        would give them. optimize_dtypes decides per column from the whole column (value range,
+        share of distinct values), so each column is read from both files together, one column
+        at a time; then each file is rewritten with the chosen dtypes, one file at a time.
+        """
+        split_file_paths = (self.data_ingestion_config.training_file_path,
+                            self.data_ingestion_config.testing_file_path)
+
+        column_dtypes = {}
+        with pa.memory_map(split_file_paths[0]) as source:
+            column_names = pa.ipc.open_file(source).schema.names
+        for column in column_names:
+            column_values = pd.concat(
+                [pd.read_feather(file_path, columns=[column]) for file_path in split_file_paths],
+                ignore_index=True
+            )
+            column_dtypes[column] = optimize_dtypes(column_values)[column].dtype
+            del column_values
+
+        for file_path in split_file_paths:
+            data = pd.read_feather(file_path).astype(column_dtypes)
+            self._write_feather(data, file_path)
+            del data
+
+    def _write_train_test(self, dataframe: DataFrame, is_test: np.ndarray) -> None:
+        """
+        Save the train and test splits of dataframe (selected by the is_test mask) as Feather.
+        Runs on the writer thread; the splits are written one after the other.
+        """
+        try:
+            logging.info("Exporting train and test file path.")
+
+            # Save train and test datasets as uncompressed Feather without index, one after the other;
+            # the later stages then read them back without any parsing or decompression
+            for mask, file_path in (
+                (~is_test, self.data_ingestion_config.training_file_path),
+                (is_test, self.data_ingestion_config.testing_file_path),
+            ):
+                data = dataframe.loc[mask]
+                self._write_feather(data, file_path)
+                del data  # Free this split before the next one is materialised
+
+            logging.info("Exported train and test file path.")  # Confirm save completion
+
+        except Exception as e:
+            raise MyException(e, sys) from e
+
+    def split_data_as_train_test(self, dataframe: DataFrame) -> Future:
+        """
+        Split the given DataFrame into training and testing datasets, and save as Feather in the background.
 
         Parameters:
         ----------
@@ -95,23 +210,32 @@ class DataIngestion:
         Process:
         --------
         1. Log entry into the method for debugging.
-        2. Split DataFrame using sklearn's train_test_split with configured ratio.
+        2. Mark a random subset of rows (configured ratio) as test with a boolean mask.
         3. Log successful split.
         4. Ensure output directory for train/test files exists.
-        5. Save train and test DataFrames to their respective CSV paths.
-        6. Log completion and exit.
+        5. Hand the dataframe and mask to the writer thread, which saves the train split, then the test split.
+
+        Returns:
+        --------
+        Future
+            Completes once both files are written; result() re-raises any write error.
 
         Raises:
         ------
-        MyException for any errors during split or file writing.
+        MyException for any errors during split; write errors are raised through the returned Future.
         """
         logging.info("Entered split_data_as_train_test method of Data_Ingestion class")
 
         try:
-            # Split data; test size taken from config, train is complementary
-            train_set, test_set = train_test_split(
-                dataframe, test_size=self.data_ingestion_config.train_test_split_ratio
-            )
+            # Split data; test size taken from config (rounded up, as sklearn does), train is complementary.
+            # Only a boolean mask is built here: each split is materialised right before it is written
+            # and released right after, so at most one copy exists next to the input at any time.
+            n_rows = len(dataframe)
+            n_test = int(np.ceil(n_rows * self.data_ingestion_config.train_test_split_ratio))
+            permutation = np.random.default_rng(self.data_ingestion_config.random_state).permutation(n_rows)
+            is_test = np.zeros(n_rows, dtype=bool)
+            is_test[permutation[:n_test]] = True  # Exact test size, unlike rng.random(n) < ratio
+            del permutation
             logging.info("Performed train test split on the dataframe")  # Log successful split
 
             logging.info("Exited split_data_as_train_test method of Data_Ingestion class")
@@ -120,18 +244,42 @@ class DataIngestion:
             dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
             os.makedirs(dir_path, exist_ok=True)  # Create directory if missing
 
-            logging.info(f"Exporting train and test file path.")
+            return self._writer.submit(self._write_train_test, dataframe, is_test)
 
-            # Save train dataset CSV without index and with header
-            train_set.to_csv(self.data_ingestion_config.training_file_path, index=False, header=True)
+        except Exception as e:
+            # Raise exception with stack trace if splitting or saving fails
+            raise MyException(e, sys) from e
 
-            # Save test dataset CSV without index and with header
-            test_set.to_csv(self.data_ingestion_config.testing_file_path, index=False, header=True)
+    def split_data_in_database(self) -> None:
+        """
+        Split the MongoDB collection into training and testing datasets on the server,
+        streaming each straight into its Feather file. No feature store file is written.
+        The files are then given the same dtypes as on the in-memory split path.
+
+        Raises:
+        ------
+        MyException for any errors during split or file writing.
+        """
+        logging.info("Entered split_data_in_database method of Data_Ingestion class")
+
+        try:
+            # Get directory path of training file to ensure it exists before saving
+            dir_path = os.path.dirname(self.data_ingestion_config.training_file_path)
+            os.makedirs(dir_path, exist_ok=True)  # Create directory if missing
+
+            Proj1Data().export_collection_split_as_feather(
+                collection_name=self.data_ingestion_config.collection_name,
+                train_file_path=self.data_ingestion_config.training_file_path,
+                test_file_path=self.data_ingestion_config.testing_file_path,
+                test_ratio=self.data_ingestion_config.train_test_split_ratio
+            )
+
+            # Downcast numbers / use categories exactly as export_collection_as_dataframe does
+            self._optimize_split_dtypes()
 
-            logging.info(f"Exported train and test file path.")  # Confirm save completion
+            logging.info("Exited split_data_in_database method of Data_Ingestion class")
 
         except Exception as e:
-            # Raise exception with stack trace if splitting or saving fails
             raise MyException(e, sys) from e
 
     def initiate_data_ingestion(self) -> DataIngestionArtifact:
@@ -140,14 +288,16 @@ class DataIngestion:
 
         Steps:
         ------
-        1. Export data from MongoDB collection into feature store CSV.
-        2. Split this exported data into training and testing CSV files.
-        3. Create and return a DataIngestionArtifact with file paths.
+        1. Export data from MongoDB collection into feature store Parquet file.
+        2. Split this exported data into training and testing Feather files.
+        3. Create and return a DataIngestionArtifact with file paths, without waiting for the writes;
+           the artifact carries their futures so the next stage can wait before opening the files.
+        With server_side_split set, steps 1-2 are replaced by a split inside MongoDB (no feature store).
 
         Returns:
         --------
         DataIngestionArtifact
-            Contains file paths of the saved training and testing CSV datasets.
+            Contains file paths of the saved training and testing Feather datasets.
 
         Raises:
         -------
@@ -156,25 +306,32 @@ class DataIngestion:
         logging.info("Entered initiate_data_ingestion method of Data_Ingestion class")
 
         try:
-            # Export the full dataset from MongoDB into CSV and get DataFrame
-            dataframe = self.export_data_into_feature_store()
+            pending_writes = ()
+            if self.data_ingestion_config.server_side_split:
+                # Let MongoDB split the collection; nothing is held in memory here
+                self.split_data_in_database()
+            else:
+                # Export the full dataset from MongoDB into Parquet and get DataFrame
+                dataframe = self.export_data_into_feature_store()
 
-            logging.info("Got the data from mongodb")  # Log fetch success
+                logging.info("Got the data from mongodb")  # Log fetch success
 
-            # Split the full dataset into train/test CSV files
-            self.split_data_as_train_test(dataframe)
+                # Split the full dataset into train/test Feather files; the next stage waits on these writes only
+                pending_writes = (self.split_data_as_train_test(dataframe),)
+            self._submit_deferred_copies()  # Queued behind the train/test write
 
             logging.info("Performed train test split on the dataset")  # Log split success
 
             logging.info("Exited initiate_data_ingestion method of Data_Ingestion class")
 
-            # Prepare artifact with train and test CSV paths for downstream use
+            # Prepare artifact with train and test Feather paths for downstream use
             data_ingestion_artifact = DataIngestionArtifact(
                 trained_file_path=self.data_ingestion_config.training_file_path,
-                test_file_path=self.data_ingestion_config.testing_file_path
+                test_file_path=self.data_ingestion_config.testing_file_path,
+                pending_writes=pending_writes
             )
 
-            logging.info(f"Data ingestion artifact: {data_ingestion_artifact}")  # Log artifact details
+            logging.info("Data ingestion artifact: %s", data_ingestion_artifact)  # Log artifact details
 
             # Return artifact to next stage (like data validation)
             return data_ingestion_artifact
@@ -182,3 +339,7 @@ class DataIngestion:
         except Exception as e:
             # Catch and raise any exception with full traceback
             raise MyException(e, sys) from e
+
+        finally:
+            # Let queued writes finish but accept no more; on failure too, so the writer thread exits
+            self._writer.shutdown(wait=False)
@@ -1,6 +1,7 @@
 import sys
 import numpy as np
 import pandas as pd
+from typing import Optional
 from imblearn.combine import SMOTEENN
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
@@ -11,7 +12,7 @@ from src.entity.config_entity import DataTransformationConfig
 from src.entity.artifact_entity import DataTransformationArtifact, DataIngestionArtifact, DataValidationArtifact
 from src.exception import MyException
 from src.logger import logging
-from src.utils.main_utils import save_object, save_numpy_array_data, read_yaml_file
+from src.utils.main_utils import save_object, save_numpy_array_data, read_yaml_file, wait_for_pending_writes
 
 
 class DataTransformation:
@@ -29,7 +30,7 @@ class DataTransformation:
     @staticmethod
     def read_data(file_path) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return pd.read_feather(file_path)
         except Exception as e:
             raise MyException(e, sys)
 
@@ -78,21 +79,19 @@ class DataTransformation:
         return df
 
     def _create_dummy_columns(self, df):
-        """Create dummy variables for categorical features."""
+        """Create integer dummy variables for categorical features."""
         logging.info("Creating dummy variables for categorical features")
-        df = pd.get_dummies(df, drop_first=True)
+        # dtype=int builds the 0/1 columns as integers directly, no bool -> int cast pass afterwards
+        df = pd.get_dummies(df, drop_first=True, dtype=int)
         return df
 
     def _rename_columns(self, df):
-        """Rename specific columns and ensure integer types for dummy columns."""
-        logging.info("Renaming specific columns and casting to int")
+        """Rename specific dummy columns (already integer, see _create_dummy_columns)."""
+        logging.info("Renaming specific columns")
         df = df.rename(columns={
             "Vehicle_Age_< 1 Year": "Vehicle_Age_lt_1_Year",
             "Vehicle_Age_> 2 Years": "Vehicle_Age_gt_2_Years"
         })
-        for col in ["Vehicle_Age_lt_1_Year", "Vehicle_Age_gt_2_Years", "Vehicle_Damage_Yes"]:
-            if col in df.columns:
-                df[col] = df[col].astype('int')
         return df
 
     def _drop_id_column(self, df):
@@ -103,19 +102,24 @@ class DataTransformation:
             df = df.drop(drop_col, axis=1)
         return df
 
-    def initiate_data_transformation(self) -> DataTransformationArtifact:
+    def initiate_data_transformation(self, train_df: Optional[pd.DataFrame] = None,
+                                     test_df: Optional[pd.DataFrame] = None) -> DataTransformationArtifact:
         """
         Initiates the data transformation component for the pipeline.
+        train_df/test_df: frames already loaded by the caller (read from the ingestion artifact when None);
+                          they are not modified
         """
         try:
             logging.info("Data Transformation Started !!!")
             if not self.data_validation_artifact.validation_status:
                 raise Exception(self.data_validation_artifact.message)
 
-            # Load train and test data
-            train_df = self.read_data(file_path=self.data_ingestion_artifact.trained_file_path)
-            test_df = self.read_data(file_path=self.data_ingestion_artifact.test_file_path)
-            logging.info("Train-Test data loaded")
+            # Load train and test data unless the caller already did
+            if train_df is None or test_df is None:
+                wait_for_pending_writes(self.data_ingestion_artifact.pending_writes)
+                train_df = self.read_data(file_path=self.data_ingestion_artifact.trained_file_path)
+                test_df = self.read_data(file_path=self.data_ingestion_artifact.test_file_path)
+                logging.info("Train-Test data loaded")
 
             input_feature_train_df = train_df.drop(columns=[TARGET_COLUMN], axis=1)
             target_feature_train_df = train_df[TARGET_COLUMN]
@@ -5,10 +5,11 @@ import os
 import pandas as pd
 
 from pandas import DataFrame
+from typing import Optional
 
 from src.exception import MyException
 from src.logger import logging
-from src.utils.main_utils import read_yaml_file
+from src.utils.main_utils import read_yaml_file, wait_for_pending_writes
 from src.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact
 from src.entity.config_entity import DataValidationConfig
 from src.constants import SCHEMA_FILE_PATH
@@ -37,7 +38,7 @@ class DataValidation:
         """
         try:
             status = len(dataframe.columns) == len(self._schema_config["columns"])
-            logging.info(f"Is required column present: [{status}]")
+            logging.info("Is required column present: [%s]", status)
             return status
         except Exception as e:
             raise MyException(e, sys)
@@ -59,7 +60,7 @@ class DataValidation:
                     missing_numerical_columns.append(column)
 
             if len(missing_numerical_columns)>0:
-                logging.info(f"Missing numerical column: {missing_numerical_columns}")
+                logging.info("Missing numerical column: %s", missing_numerical_columns)
 
 
             for column in self._schema_config["categorical_columns"]:
@@ -67,7 +68,7 @@ class DataValidation:
                     missing_categorical_columns.append(column)
 
             if len(missing_categorical_columns)>0:
-                logging.info(f"Missing categorical column: {missing_categorical_columns}")
+                logging.info("Missing categorical column: %s", missing_categorical_columns)
 
             return False if len(missing_categorical_columns)>0 or len(missing_numerical_columns)>0 else True
         except Exception as e:
@@ -76,15 +77,17 @@ class DataValidation:
     @staticmethod
     def read_data(file_path) -> DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return pd.read_feather(file_path)
         except Exception as e:
             raise MyException(e, sys)
         
 
-    def initiate_data_validation(self) -> DataValidationArtifact:
+    def initiate_data_validation(self, train_df: Optional[DataFrame] = None,
+                                 test_df: Optional[DataFrame] = None) -> DataValidationArtifact:
         """
         Method Name :   initiate_data_validation
         Description :   This method initiates the data validation component for the pipeline
+        Input       :   train_df/test_df already loaded by the caller (read from the ingestion artifact when None)
         
         Output      :   Returns bool value based on validation results
         On Failure  :   Write an exception log and then raise an exception
@@ -93,34 +96,36 @@ class DataValidation:
         try:
             validation_error_msg = ""
             logging.info("Starting data validation")
-            train_df, test_df = (DataValidation.read_data(file_path=self.data_ingestion_artifact.trained_file_path),
-                                 DataValidation.read_data(file_path=self.data_ingestion_artifact.test_file_path))
+            if train_df is None or test_df is None:
+                wait_for_pending_writes(self.data_ingestion_artifact.pending_writes)
+                train_df, test_df = (DataValidation.read_data(file_path=self.data_ingestion_artifact.trained_file_path),
+                                     DataValidation.read_data(file_path=self.data_ingestion_artifact.test_file_path))
 
             # Checking col len of dataframe for train/test df
             status = self.validate_number_of_columns(dataframe=train_df)
             if not status:
                 validation_error_msg += f"Columns are missing in training dataframe. "
             else:
-                logging.info(f"All required columns present in training dataframe: {status}")
+                logging.info("All required columns present in training dataframe: %s", status)
 
             status = self.validate_number_of_columns(dataframe=test_df)
             if not status:
                 validation_error_msg += f"Columns are missing in test dataframe. "
             else:
-                logging.info(f"All required columns present in testing dataframe: {status}")
+                logging.info("All required columns present in testing dataframe: %s", status)
 
             # Validating col dtype for train/test df
             status = self.is_column_exist(df=train_df)
             if not status:
                 validation_error_msg += f"Columns are missing in training dataframe. "
             else:
-                logging.info(f"All categorical/int columns present in training dataframe: {status}")
+                logging.info("All categorical/int columns present in training dataframe: %s", status)
 
             status = self.is_column_exist(df=test_df)
             if not status:
                 validation_error_msg += f"Columns are missing in test dataframe."
             else:
-                logging.info(f"All categorical/int columns present in testing dataframe: {status}")
+                logging.info("All categorical/int columns present in testing dataframe: %s", status)
 
             validation_status = len(validation_error_msg) == 0
 
@@ -144,7 +149,7 @@ class DataValidation:
                 json.dump(validation_report, report_file, indent=4)
 
             logging.info("Data validation artifact created and saved to JSON file.")
-            logging.info(f"Data validation artifact: {data_validation_artifact}")
+            logging.info("Data validation artifact: %s", data_validation_artifact)
             return data_validation_artifact
         except Exception as e:
             raise MyException(e, sys) from e
\ No newline at end of file
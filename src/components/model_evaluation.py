@@ -4,7 +4,7 @@ from sklearn.metrics import f1_score
 from src.exception import MyException
 from src.constants import TARGET_COLUMN
 from src.logger import logging
-from src.utils.main_utils import load_object
+from src.utils.main_utils import wait_for_pending_writes
 import sys
 import pandas as pd
 from typing import Optional
@@ -22,11 +22,16 @@ class EvaluateModelResponse:
 class ModelEvaluation:
 
     def __init__(self, model_eval_config: ModelEvaluationConfig, data_ingestion_artifact: DataIngestionArtifact,
-                 model_trainer_artifact: ModelTrainerArtifact):
+                 model_trainer_artifact: ModelTrainerArtifact, best_model: Optional[Proj1Estimator] = None):
+        """
+        :param best_model: Production model already fetched from s3 (e.g. prefetched while training);
+                           when None it is looked up in s3 by get_best_model
+        """
         try:
             self.model_eval_config = model_eval_config
             self.data_ingestion_artifact = data_ingestion_artifact
             self.model_trainer_artifact = model_trainer_artifact
+            self.best_model = best_model
         except Exception as e:
             raise MyException(e, sys) from e
 
@@ -39,6 +44,9 @@ class ModelEvaluation:
         On Failure  :   Write an exception log and then raise an exception
         """
         try:
+            if self.best_model is not None:
+                return self.best_model
+
             bucket_name = self.model_eval_config.bucket_name
             model_path=self.model_eval_config.s3_model_key_path
             proj1_estimator = Proj1Estimator(bucket_name=bucket_name,
@@ -57,28 +65,26 @@ class ModelEvaluation:
         return df
 
     def _create_dummy_columns(self, df):
-        """Create dummy variables for categorical features."""
+        """Create integer dummy variables for categorical features."""
         logging.info("Creating dummy variables for categorical features")
-        df = pd.get_dummies(df, drop_first=True)
+        # dtype=int builds the 0/1 columns as integers directly, no bool -> int cast pass afterwards
+        df = pd.get_dummies(df, drop_first=True, dtype=int)
         return df
 
     def _rename_columns(self, df):
-        """Rename specific columns and ensure integer types for dummy columns."""
-        logging.info("Renaming specific columns and casting to int")
+        """Rename specific dummy columns (already integer, see _create_dummy_columns)."""
+        logging.info("Renaming specific columns")
         df = df.rename(columns={
             "Vehicle_Age_< 1 Year": "Vehicle_Age_lt_1_Year",
             "Vehicle_Age_> 2 Years": "Vehicle_Age_gt_2_Years"
         })
-        for col in ["Vehicle_Age_lt_1_Year", "Vehicle_Age_gt_2_Years", "Vehicle_Damage_Yes"]:
-            if col in df.columns:
-                df[col] = df[col].astype('int')
         return df
     
     def _drop_id_column(self, df):
         """Drop the 'id' column if it exists."""
         logging.info("Dropping 'id' column")
-        if "_id" in df.columns:
-            df = df.drop("_id", axis=1)
+        if "id" in df.columns:
+            df = df.drop("id", axis=1)
         return df
 
     def evaluate_model(self) -> EvaluateModelResponse:
@@ -91,7 +97,8 @@ class ModelEvaluation:
         On Failure  :   Write an exception log and then raise an exception
         """
         try:
-            test_df = pd.read_csv(self.data_ingestion_artifact.test_file_path)
+            wait_for_pending_writes(self.data_ingestion_artifact.pending_writes)
+            test_df = pd.read_feather(self.data_ingestion_artifact.test_file_path)
             x, y = test_df.drop(TARGET_COLUMN, axis=1), test_df[TARGET_COLUMN]
 
             logging.info("Test data loaded and now transforming it for prediction...")
@@ -101,18 +108,17 @@ class ModelEvaluation:
             x = self._create_dummy_columns(x)
             x = self._rename_columns(x)
 
-            trained_model = load_object(file_path=self.model_trainer_artifact.trained_model_file_path)
-            logging.info("Trained model loaded/exists.")
+            # The trained model's score comes from the trainer artifact; the pickle itself is not needed here
             trained_model_f1_score = self.model_trainer_artifact.metric_artifact.f1_score
-            logging.info(f"F1_Score for this model: {trained_model_f1_score}")
+            logging.info("F1_Score for this model: %s", trained_model_f1_score)
 
             best_model_f1_score=None
             best_model = self.get_best_model()
             if best_model is not None:
-                logging.info(f"Computing F1_Score for production model..")
+                logging.info("Computing F1_Score for production model..")
                 y_hat_best_model = best_model.predict(x)
                 best_model_f1_score = f1_score(y, y_hat_best_model)
-                logging.info(f"F1_Score-Production Model: {best_model_f1_score}, F1_Score-New Trained Model: {trained_model_f1_score}")
+                logging.info("F1_Score-Production Model: %s, F1_Score-New Trained Model: %s", best_model_f1_score, trained_model_f1_score)
             
             tmp_best_model_score = 0 if best_model_f1_score is None else best_model_f1_score
             result = EvaluateModelResponse(trained_model_f1_score=trained_model_f1_score,
@@ -120,7 +126,7 @@ class ModelEvaluation:
                                            is_model_accepted=trained_model_f1_score > tmp_best_model_score,
                                            difference=trained_model_f1_score - tmp_best_model_score
                                            )
-            logging.info(f"Result: {result}")
+            logging.info("Result: %s", result)
             return result
 
         except Exception as e:
@@ -146,7 +152,7 @@ class ModelEvaluation:
                 trained_model_path=self.model_trainer_artifact.trained_model_file_path,
                 changed_accuracy=evaluate_model_response.difference)
 
-            logging.info(f"Model evaluation artifact: {model_evaluation_artifact}")
+            logging.info("Model evaluation artifact: %s", model_evaluation_artifact)
             return model_evaluation_artifact
         except Exception as e:
             raise MyException(e, sys) from e
\ No newline at end of file
@@ -41,7 +41,7 @@ class ModelPusher:
                                                         s3_model_path=self.model_pusher_config.s3_model_key_path)
 
             logging.info("Uploaded artifacts folder to s3 bucket")
-            logging.info(f"Model pusher artifact: [{model_pusher_artifact}]")
+            logging.info("Model pusher artifact: [%s]", model_pusher_artifact)
             logging.info("Exited initiate_model_pusher method of ModelTrainer class")
             
             return model_pusher_artifact
@@ -107,7 +107,7 @@ class ModelTrainer:
                 trained_model_file_path=self.model_trainer_config.trained_model_file_path,
                 metric_artifact=metric_artifact,
             )
-            logging.info(f"Model trainer artifact: {model_trainer_artifact}")
+            logging.info("Model trainer artifact: %s", model_trainer_artifact)
             return model_trainer_artifact
         
         except Exception as e:
@@ -1,6 +1,7 @@
 # Standard library imports
 import os            # For accessing environment variables (e.g., MongoDB connection string)
 import sys           # For capturing exception information (used in custom exceptions)
+from functools import lru_cache  # For building one MongoDBClient per database name
 
 # External libraries
 import pymongo       # PyMongo is the official MongoDB driver for Python
@@ -9,7 +10,9 @@ import certifi       # Provides SSL certificates to securely connect to MongoDB
 # Project-specific imports
 from src.exception import MyException     # Custom exception class to wrap and handle exceptions uniformly
 from src.logger import logging            # Custom logger to write logs (info, warnings, errors)
-from src.constants import DATABASE_NAME, MONGODB_URL_KEY  # Constants defined for DB name and MongoDB URL env key
+from src.constants import (  # Constants defined for DB name, MongoDB URL env key and client tuning
+    DATABASE_NAME, MONGODB_URL_KEY, MONGODB_MAX_POOL_SIZE, MONGODB_COMPRESSORS, MONGODB_APP_NAME
+)
 
 
 
@@ -59,8 +62,16 @@ class MongoDBClient:
                 if mongo_db_url is None:
                     raise Exception(f"Environment variable '{MONGODB_URL_KEY}' is not set.")
 
-                # Create a secure MongoClient using SSL certificate from certifi
-                MongoDBClient.client = pymongo.MongoClient(mongo_db_url, tlsCAFile=ca)
+                # Create a secure MongoClient using SSL certificate from certifi.
+                # Wire compression shrinks the bulk export traffic; compressors whose
+                # Python package is not installed are skipped by PyMongo with a warning.
+                MongoDBClient.client = pymongo.MongoClient(
+                    mongo_db_url,
+                    tlsCAFile=ca,
+                    maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                    compressors=MONGODB_COMPRESSORS,
+                    appname=MONGODB_APP_NAME,
+                )
 
             # Set instance variables from the class-level client
             self.client = MongoDBClient.client  # Reuse the already established connection
@@ -73,3 +84,20 @@ class MongoDBClient:
         except Exception as e:
             # Raise a custom exception with system traceback information
             raise MyException(e, sys)
+
+
+@lru_cache(maxsize=None)
+def get_mongodb_client(database_name: str = DATABASE_NAME) -> MongoDBClient:
+    """
+    Returns the MongoDBClient for the given database, constructing it only on first use.
+
+    Later calls with the same database name reuse the same instance, skipping the
+    environment lookup, database handle creation and connection log of __init__.
+    Failed constructions raise and are not cached.
+
+    Parameters:
+    ----------
+    database_name : str, optional
+        The name of the MongoDB database to connect to (default is from constants.py)
+    """
+    return MongoDBClient(database_name=database_name)
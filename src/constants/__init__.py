@@ -9,6 +9,11 @@ from datetime import date  # To get the current date, here used to fetch current
 DATABASE_NAME = "Proj1"  # MongoDB database name
 COLLECTION_NAME = "Proj1-Data"  # MongoDB collection name inside the database
 MONGODB_URL_KEY = "MONGODB_URL"  # Environment variable key to fetch the MongoDB URL
+MONGODB_BATCH_SIZE: int = 8000  # Documents fetched per cursor round-trip (PyMongo default is 101)
+MONGODB_PREFETCH_BATCHES: int = 4  # Max decoded batches the fetch thread may run ahead of the consumer (fetch-ahead depth, not total export memory)
+MONGODB_MAX_POOL_SIZE: int = 32  # Upper bound on pooled connections per MongoClient (PyMongo default is 100)
+MONGODB_COMPRESSORS: str = "zstd,snappy,zlib"  # Wire compression, in order of preference
+MONGODB_APP_NAME: str = "ingest"  # Client name reported to the server (shows up in logs and currentOp)
 
 
 
@@ -26,9 +31,9 @@ TARGET_COLUMN = "Response"  # Name of the target column in the dataset (used for
 CURRENT_YEAR = date.today().year  # Dynamically fetches the current year (e.g., 2025)
 PREPROCSSING_OBJECT_FILE_NAME = "preprocessing.pkl"  # File name for saving preprocessing pipeline (e.g., scalers)
 
-FILE_NAME: str = "data.csv"  # Main data file name (raw input)
-TRAIN_FILE_NAME: str = "train.csv"  # File name to store training dataset
-TEST_FILE_NAME: str = "test.csv"  # File name to store testing dataset
+FILE_NAME: str = "data.parquet"  # Main data file name (raw input)
+TRAIN_FILE_NAME: str = "train.feather"  # File name to store training dataset (uncompressed Arrow, re-read by several stages)
+TEST_FILE_NAME: str = "test.feather"  # File name to store testing dataset (uncompressed Arrow, re-read by several stages)
 SCHEMA_FILE_PATH = os.path.join("config", "schema.yaml")  # Path to schema definition file
 
 
@@ -45,8 +50,11 @@ REGION_NAME = "us-east-1"  # AWS region where resources (like S3 bucket) are hos
 DATA_INGESTION_COLLECTION_NAME: str = "Proj1-Data"  # MongoDB collection name used in data ingestion
 DATA_INGESTION_DIR_NAME: str = "data_ingestion"  # Directory for storing ingestion-related files
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"  # Directory to store feature store data
+DATA_INGESTION_FEATURE_STORE_CACHE_DIR: str = "feature_store_cache"  # Directory (under ARTIFACT_DIR, shared across runs) caching exports by collection fingerprint
 DATA_INGESTION_INGESTED_DIR: str = "ingested"  # Directory to store split ingested train/test data
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO: float = 0.25  # Ratio to split data into test (25%) and train (75%)
+DATA_INGESTION_RANDOM_STATE = None  # Seed for the train/test shuffle (None draws a fresh split on every run)
+DATA_INGESTION_SERVER_SIDE_SPLIT: bool = False  # Split with $sample inside MongoDB and skip the feature store dump (needs write access; not seeded by RANDOM_STATE)
 
 
 
@@ -1,19 +1,101 @@
 # === Importing Required Libraries ===
 
 import sys                         # For accessing exception traceback info
+import hashlib                     # For fingerprinting collection state
+import math                        # For rounding the test sample size up
+import queue                       # For handing fetched batches from the network thread to the writer
+import threading                   # For fetching from MongoDB while the previous batch is written
+import time                        # For timing each batch fetched from MongoDB
+import uuid                        # For naming temporary split collections
 import pandas as pd               # For handling tabular data using DataFrames
-import numpy as np                # For handling missing values (np.nan)
-from typing import Optional       # For specifying optional function parameters
+import pyarrow as pa              # For building columnar tables straight from the cursor
+import pyarrow.compute as pc      # For nulling the "na" sentinel in text columns
+import pyarrow.parquet as pq      # For streaming batches into the feature store file
+# PyMongoArrowContext is pymongoarrow's internal decoder API, so pymongoarrow (and the pyarrow
+# release it is built against) are pinned in requirements.txt
+from pymongoarrow.context import PyMongoArrowContext  # C++ BSON -> Arrow column builders
+from pymongoarrow.schema import Schema                # Typed schema for the BSON decoder
+from typing import Iterable, Iterator, Optional, Tuple  # For type hints
 
 # === Project-Specific Imports ===
 
-from src.configuration.mongo_db_connection import MongoDBClient   # For MongoDB connection management
-from src.constants import DATABASE_NAME                            # Constant for default database name
+from src.configuration.mongo_db_connection import get_mongodb_client  # For shared MongoDB connection management
+from src.constants import DATABASE_NAME, MONGODB_BATCH_SIZE, MONGODB_PREFETCH_BATCHES, SCHEMA_FILE_PATH  # Mongo/schema settings
 from src.exception import MyException                              # Custom exception class for robust error handling
+from src.logger import logging                                     # Custom logger for progress messages
+from src.utils.main_utils import read_yaml_file, optimize_dtypes   # Schema loading and dtype downcasting
 
 
 
 
+# Literal string used in the source data to mark a missing value
+NA_SENTINEL = "na"
+
+# Arrow type for each dtype name used in config/schema.yaml, so every batch shares one schema
+SCHEMA_ARROW_TYPES = {"int": pa.int64(), "float": pa.float64(), "category": pa.string()}
+
+# Marks the end of the producer's output in _prefetch
+_END_OF_STREAM = object()
+
+
+def _prefetch(items: Iterable, max_pending: int) -> Iterator:
+    """
+    Iterates `items` on a background thread and yields them through a bounded queue,
+    so producing the next item (e.g. waiting on the network) overlaps with whatever
+    the caller does with the current one. Errors raised by the producer are re-raised
+    in the caller; closing the generator early stops the producer.
+    """
+    pending = queue.Queue(maxsize=max_pending)
+    stopped = threading.Event()
+
+    def put(entry) -> bool:
+        while not stopped.is_set():
+            try:
+                pending.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((_END_OF_STREAM, None))
+        except Exception as e:
+            put((_END_OF_STREAM, e))
+
+    producer = threading.Thread(target=produce, name="mongo-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = pending.get()
+            if error is not None:
+                raise error
+            if item is _END_OF_STREAM:
+                return
+            yield item
+    finally:
+        stopped.set()
+        producer.join()
+
+
+def _timed_batches(raw_batches) -> Iterator[bytes]:
+    """
+    Yields the raw batches of a MongoDB cursor, logging (at debug level) how long each
+    one took to arrive, and closes the cursor as soon as it is exhausted or fails
+    instead of leaving it open on the server until garbage collection.
+    """
+    with raw_batches:
+        started = time.perf_counter()
+        for batch_number, raw_batch in enumerate(raw_batches, start=1):
+            logging.debug("Fetched batch %s (%s bytes) in %.3fs", batch_number, len(raw_batch),
+                          time.perf_counter() - started)
+            yield raw_batch
+            started = time.perf_counter()  # Time only the wait on the network, not the decoding
+
+
 # === Class Definition ===
 
 class Proj1Data:
@@ -24,11 +106,25 @@ class Proj1Data:
 
     def __init__(self) -> None:
         """
-        Initializes a MongoDB client using the default database name.
+        Initializes a MongoDB client using the default database name and builds
+        the server-side projection from the schema's column whitelist.
         """
         try:
-            # Create an instance of the MongoDB client
-            self.mongo_client = MongoDBClient(database_name=DATABASE_NAME)
+            # Reuse the MongoDB client shared by every Proj1Data for this database
+            self.mongo_client = get_mongodb_client(database_name=DATABASE_NAME)
+
+            # Only the schema columns are sent over the wire; '_id' is always excluded
+            schema_config = read_yaml_file(file_path=SCHEMA_FILE_PATH)
+            self.schema_columns = [field for column in schema_config["columns"] for field in column]
+            self.projection = {field: 1 for field in self.schema_columns}
+            self.projection["_id"] = 0
+
+            # Fixed Arrow schema so batches can be streamed into one Parquet file
+            self.arrow_schema = pa.schema([
+                (field, SCHEMA_ARROW_TYPES[dtype])
+                for column in schema_config["columns"] for field, dtype in column.items()
+            ])
+            self.bson_schema = Schema({field.name: field.type for field in self.arrow_schema})
 
         except Exception as e:
             # Raise custom exception with traceback info if connection fails
@@ -36,10 +132,164 @@ class Proj1Data:
         
         
 
-    def export_collection_as_dataframe(self, collection_name: str, database_name: Optional[str] = None) -> pd.DataFrame:
+    def _get_collection(self, collection_name: str, database_name: Optional[str] = None):
+        """
+        Returns the collection from the default database, or from database_name when given.
+        """
+        if database_name is None:
+            return self.mongo_client.database[collection_name]
+        return self.mongo_client.client[database_name][collection_name]
+
+    def get_collection_fingerprint(self, collection_name: str, database_name: Optional[str] = None) -> str:
+        """
+        Builds a short hash describing the current state of a collection.
+
+        The key combines the collection name, its estimated document count, the newest
+        '_id' (ObjectIds grow with insertion time) and the projected schema columns, so it
+        changes when documents are inserted or removed or the schema changes. In-place
+        updates to existing documents are not detected.
+
+        Parameters:
+        ----------
+        collection_name : str
+            The name of the MongoDB collection to fingerprint.
+
+        database_name : Optional[str]
+            Name of the database. If not provided, uses the default DATABASE_NAME.
+
+        Returns:
+        -------
+        str
+            A hex digest usable as a cache file name.
+        """
+        try:
+            collection = self._get_collection(collection_name, database_name)
+
+            # Both lookups are answered from collection metadata / the _id index
+            document_count = collection.estimated_document_count()
+            latest_document = collection.find_one({}, projection={"_id": 1}, sort=[("_id", -1)])
+            latest_id = latest_document["_id"] if latest_document else None
+
+            key = f"{collection.full_name}|{document_count}|{latest_id}|{','.join(self.schema_columns)}"
+            return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def _decode_raw_batch(self, raw_batch: bytes) -> pa.Table:
+        """
+        Decodes one raw BSON batch from find_raw_batches straight into typed Arrow
+        columns using pymongoarrow's C++ builders, so no Python dict is created per
+        document. Values that do not fit a numeric column's type (the "na" sentinel)
+        come out as nulls; in text columns the sentinel is nulled by a vectorised compare.
+        """
+        context = PyMongoArrowContext(self.bson_schema, allow_invalid=True)
+        context.process_bson_stream(raw_batch)
+        table = context.finish()
+        return pa.Table.from_arrays(
+            [
+                pc.if_else(pc.equal(column, NA_SENTINEL), pa.scalar(None, type=column.type), column)
+                if pa.types.is_string(column.type) else column
+                for column in table.columns
+            ],
+            schema=self.arrow_schema,
+        )
+
+    def _write_raw_batches(self, raw_batches: Iterable[bytes], file_path: str) -> int:
+        """
+        Decodes raw BSON batches on a background thread and streams them into an uncompressed
+        Feather (Arrow IPC) file without keeping them in memory. Returns the number of rows written.
+        """
+        n_rows = 0
+        with pa.ipc.new_file(file_path, self.arrow_schema) as writer:
+            for table in _prefetch(map(self._decode_raw_batch, _timed_batches(raw_batches)),
+                                   max_pending=MONGODB_PREFETCH_BATCHES):
+                writer.write_table(table)
+                n_rows += table.num_rows
+        return n_rows
+
+    def export_collection_split_as_feather(self, collection_name: str, train_file_path: str, test_file_path: str,
+                                           test_ratio: float, database_name: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Splits a MongoDB collection into train and test sets on the server and streams
+        each one straight into its Feather file, so the full dataset never sits in this process.
+
+        The test set is drawn with $sample and materialised into a temporary collection
+        with $out; the train set is its complement, found with a $lookup anti-join on '_id'.
+        The temporary collection is always dropped afterwards.
+
+        Parameters:
+        ----------
+        collection_name : str
+            The name of the MongoDB collection to split.
+
+        train_file_path : str
+            Feather file receiving the training rows.
+
+        test_file_path : str
+            Feather file receiving the testing rows.
+
+        test_ratio : float
+            Share of documents going to the test set (rounded up).
+
+        database_name : Optional[str]
+            Name of the database. If not provided, uses the default DATABASE_NAME.
+
+        Returns:
+        -------
+        Tuple[int, int]
+            Number of rows written to the train and test files.
+        """
+        try:
+            collection = self._get_collection(collection_name, database_name)
+            n_test = math.ceil(collection.count_documents({}) * test_ratio)  # Rounded up, as sklearn does
+            sample_collection = collection.database[f"{collection.name}_test_sample_{uuid.uuid4().hex}"]
+
+            try:
+                # === Step 1: Sample the test documents into a temporary collection ===
+                logging.info("Sampling %s test documents in MongoDB into %s", n_test, sample_collection.name)
+                collection.aggregate(
+                    [{"$sample": {"size": n_test}}, {"$out": sample_collection.name}],
+                    allowDiskUse=True
+                )
+
+                # === Step 2: Stream the test documents ===
+                test_batches = sample_collection.find_raw_batches(
+                    {}, projection=self.projection, batch_size=MONGODB_BATCH_SIZE
+                )
+                n_test_rows = self._write_raw_batches(test_batches, test_file_path)
+
+                # === Step 3: Stream every document not in the sample (anti-join on the _id index) ===
+                train_batches = collection.aggregate_raw_batches(
+                    [
+                        {"$lookup": {"from": sample_collection.name, "localField": "_id",
+                                     "foreignField": "_id", "as": "_test_match"}},
+                        {"$match": {"_test_match": {"$size": 0}}},
+                        {"$project": self.projection},
+                    ],
+                    allowDiskUse=True,
+                    batchSize=MONGODB_BATCH_SIZE
+                )
+                n_train_rows = self._write_raw_batches(train_batches, train_file_path)
+
+            finally:
+                sample_collection.drop()
+
+            logging.info("Split in MongoDB into %s train and %s test rows", n_train_rows, n_test_rows)
+            return n_train_rows, n_test_rows
+
+        except Exception as e:
+            raise MyException(e, sys)
+
+    def export_collection_as_dataframe(self, collection_name: str, database_name: Optional[str] = None,
+                                       file_path: Optional[str] = None) -> pd.DataFrame:
         """
         Exports a MongoDB collection into a pandas DataFrame.
 
+        Raw BSON batches are fetched and decoded into Arrow on a background thread
+        while the previous batch is handled (and, when file_path is given, written to
+        Parquet), so network reads overlap with disk writes.
+
         Parameters:
         ----------
         collection_name : str
@@ -48,33 +298,43 @@ class Proj1Data:
         database_name : Optional[str]
             Name of the database. If not provided, uses the default DATABASE_NAME.
 
+        file_path : Optional[str]
+            If provided, the raw batches are also streamed into this Parquet file as they arrive.
+
         Returns:
         -------
         pd.DataFrame
-            A cleaned DataFrame with '_id' column removed and 'na' values converted to np.nan.
+            A cleaned DataFrame holding the schema columns only, with 'na' values converted to np.nan.
         """
         try:
-            # === Step 1: Access the collection ===
-            if database_name is None:
-                # Use the default database if no custom name is provided
-                collection = self.mongo_client.database[collection_name]
-            else:
-                # Use a user-specified database
-                collection = self.mongo_client[database_name][collection_name]
-
-            # === Step 2: Fetch documents and load into DataFrame ===
-            print("Fetching data from MongoDB...")
-            df = pd.DataFrame(list(collection.find()))  # Convert all documents into a pandas DataFrame
-            print(f"Data fetched with length: {len(df)}")
-
-            # === Step 3: Drop 'id' column if present ===
-            if "id" in df.columns.to_list():
-                df = df.drop(columns=["id"], axis=1)
-
-            # === Step 4: Replace all string "na" with actual NaN values ===
-            df.replace({"na": np.nan}, inplace=True)
-
-            # === Step 5: Return cleaned DataFrame ===
+            # === Step 1: Access the collection (default database unless one is given) ===
+            collection = self._get_collection(collection_name, database_name)
+
+            # === Step 2: Stream Arrow batches from the cursor, writing each one as it lands ===
+            # Only schema fields are projected server-side and a large batch size cuts network round-trips.
+            # Raw batches skip PyMongo's BSON -> dict decoding entirely.
+            logging.info("Fetching data from MongoDB...")
+            raw_batches = collection.find_raw_batches({}, projection=self.projection, batch_size=MONGODB_BATCH_SIZE)
+            tables = []
+            writer = pq.ParquetWriter(file_path, self.arrow_schema, compression="zstd") if file_path else None
+            try:
+                for table in _prefetch(map(self._decode_raw_batch, _timed_batches(raw_batches)),
+                                       max_pending=MONGODB_PREFETCH_BATCHES):
+                    if writer is not None:
+                        writer.write_table(table)  # pyarrow releases the GIL while encoding and writing
+                    tables.append(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            # Arrow builds typed columns directly, so pandas skips object-dtype inference
+            df = (pa.concat_tables(tables) if tables else self.arrow_schema.empty_table()).to_pandas()
+            logging.info("Data fetched with length: %s", len(df))
+
+            # === Step 3: Shrink int64/float64/object columns for the split and later stages ===
+            df = optimize_dtypes(df)
+
+            # === Step 4: Return cleaned DataFrame ===
             return df
 
         except Exception as e:
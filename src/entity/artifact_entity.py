@@ -1,22 +1,28 @@
+from concurrent.futures import Future
 from dataclasses import dataclass
+from typing import Tuple
+
+# Artifacts are immutable records handed between stages: frozen makes them safe to share
+# and hash, slots drops the per-instance __dict__ (requires Python 3.10+)
 
 # ===============================================================
 # Artifact generated after Data Ingestion
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataIngestionArtifact:
     """
     Stores file paths for training and testing data generated during data ingestion.
     """
     trained_file_path: str  # Path to the training dataset after split
     test_file_path: str     # Path to the testing dataset after split
+    pending_writes: Tuple[Future, ...] = ()  # Writes still in flight; wait on them before opening the files
 
 # ===============================================================
 # Artifact generated after Data Validation
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataValidationArtifact:
     """
     Stores the results of data validation.
@@ -29,7 +35,7 @@ class DataValidationArtifact:
 # Artifact generated after Data Transformation
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataTransformationArtifact:
     """
     Stores transformed datasets and preprocessing object used during transformation.
@@ -42,7 +48,7 @@ class DataTransformationArtifact:
 # Metrics related to Model Evaluation
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClassificationMetricArtifact:
     """
     Stores key classification performance metrics of the model.
@@ -55,7 +61,7 @@ class ClassificationMetricArtifact:
 # Artifact generated after Model Training
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelTrainerArtifact:
     """
     Stores the trained model's path and associated performance metrics.
@@ -67,7 +73,7 @@ class ModelTrainerArtifact:
 # Artifact generated after Model Evaluation (Comparison with previous model)
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelEvaluationArtifact:
     """
     Stores evaluation results of the trained model against existing models.
@@ -81,7 +87,7 @@ class ModelEvaluationArtifact:
 # Artifact generated after Model Pusher (Deployment phase)
 # ===============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelPusherArtifact:
     """
     Stores information about the model's deployment to a remote location like S3.
@@ -1,104 +1,163 @@
 # Import standard libraries
 import os
+import threading
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Optional
 
 # Import constant variables defined elsewhere in your project
 from src.constants import *
 
-# Generate a timestamp string used for uniquely naming artifact directories
-TIMESTAMP: str = datetime.now().strftime("%m_%d_%Y_%H_%M_%S")
+
+_timestamp: Optional[str] = None
+_timestamp_lock = threading.Lock()
+
+
+def get_timestamp() -> str:
+    """
+    Timestamp string used for uniquely naming artifact directories.
+    Generated on first use (not at import) and then fixed for the rest of the process.
+    The first call is locked: pipeline stages start on worker threads and must all
+    see the same timestamp (functools.cache would let two threads build their own).
+    """
+    global _timestamp
+    if _timestamp is None:
+        with _timestamp_lock:
+            if _timestamp is None:
+                _timestamp = datetime.now().strftime("%m_%d_%Y_%H_%M_%S")
+    return _timestamp
+
+
+@cache
+def get_artifact_dir() -> str:
+    """
+    Artifact directory of the current run, i.e. ARTIFACT_DIR/<timestamp>.
+    """
+    return os.path.join(ARTIFACT_DIR, get_timestamp())
+
+
+def _stage_dir(dir_name: str):
+    """
+    Returns a default_factory building a stage directory under the run's artifact directory,
+    so the path is only computed when a config is instantiated.
+    """
+    return field(default_factory=lambda: os.path.join(get_artifact_dir(), dir_name))
+
+
+def _set_default_path(config: object, field_name: str, *path_parts: str) -> None:
+    """
+    Fills a path field left as None by joining path_parts.
+    Fields that were passed explicitly are kept; frozen dataclasses need object.__setattr__.
+    """
+    if getattr(config, field_name) is None:
+        object.__setattr__(config, field_name, os.path.join(*path_parts))
 
 # ========================================================================================
 # PIPELINE CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrainingPipelineConfig:
     """
     Configuration for the overall training pipeline.
     Stores basic identifiers like pipeline name and artifact directory.
     """
     pipeline_name: str = PIPELINE_NAME
-    artifact_dir: str = os.path.join(ARTIFACT_DIR, TIMESTAMP)
-    timestamp: str = TIMESTAMP
+    artifact_dir: Optional[str] = None
+    timestamp: str = field(default_factory=get_timestamp)
 
-# Initialize the pipeline config object
-training_pipeline_config: TrainingPipelineConfig = TrainingPipelineConfig()
+    def __post_init__(self):
+        _set_default_path(self, "artifact_dir", ARTIFACT_DIR, self.timestamp)
 
 # ========================================================================================
 # DATA INGESTION CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataIngestionConfig:
     """
     Configuration for data ingestion stage.
     Defines paths for storing raw data and split data.
     """
-    data_ingestion_dir: str = os.path.join(training_pipeline_config.artifact_dir, DATA_INGESTION_DIR_NAME)
-    feature_store_file_path: str = os.path.join(data_ingestion_dir, DATA_INGESTION_FEATURE_STORE_DIR, FILE_NAME)
-    training_file_path: str = os.path.join(data_ingestion_dir, DATA_INGESTION_INGESTED_DIR, TRAIN_FILE_NAME)
-    testing_file_path: str = os.path.join(data_ingestion_dir, DATA_INGESTION_INGESTED_DIR, TEST_FILE_NAME)
+    data_ingestion_dir: str = _stage_dir(DATA_INGESTION_DIR_NAME)
+    feature_store_file_path: Optional[str] = None
+    feature_store_cache_dir: str = os.path.join(ARTIFACT_DIR, DATA_INGESTION_FEATURE_STORE_CACHE_DIR)
+    training_file_path: Optional[str] = None
+    testing_file_path: Optional[str] = None
     train_test_split_ratio: float = DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO
+    random_state: Optional[int] = DATA_INGESTION_RANDOM_STATE
+    server_side_split: bool = DATA_INGESTION_SERVER_SIDE_SPLIT
     collection_name: str = DATA_INGESTION_COLLECTION_NAME
 
+    def __post_init__(self):
+        _set_default_path(self, "feature_store_file_path", self.data_ingestion_dir, DATA_INGESTION_FEATURE_STORE_DIR, FILE_NAME)
+        _set_default_path(self, "training_file_path", self.data_ingestion_dir, DATA_INGESTION_INGESTED_DIR, TRAIN_FILE_NAME)
+        _set_default_path(self, "testing_file_path", self.data_ingestion_dir, DATA_INGESTION_INGESTED_DIR, TEST_FILE_NAME)
+
 # ========================================================================================
 # DATA VALIDATION CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataValidationConfig:
     """
     Configuration for data validation stage.
     Defines where validation reports will be saved.
     """
-    data_validation_dir: str = os.path.join(training_pipeline_config.artifact_dir, DATA_VALIDATION_DIR_NAME)
-    validation_report_file_path: str = os.path.join(data_validation_dir, DATA_VALIDATION_REPORT_FILE_NAME)
+    data_validation_dir: str = _stage_dir(DATA_VALIDATION_DIR_NAME)
+    validation_report_file_path: Optional[str] = None
+
+    def __post_init__(self):
+        _set_default_path(self, "validation_report_file_path", self.data_validation_dir, DATA_VALIDATION_REPORT_FILE_NAME)
 
 # ========================================================================================
 # DATA TRANSFORMATION CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataTransformationConfig:
     """
     Configuration for data transformation stage.
     Specifies paths to transformed training/testing data and transformation objects.
     """
-    data_transformation_dir: str = os.path.join(training_pipeline_config.artifact_dir, DATA_TRANSFORMATION_DIR_NAME)
-    transformed_train_file_path: str = os.path.join(
-        data_transformation_dir,
-        DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-        TRAIN_FILE_NAME.replace("csv", "npy")
-    )
-    transformed_test_file_path: str = os.path.join(
-        data_transformation_dir,
-        DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
-        TEST_FILE_NAME.replace("csv", "npy")
-    )
-    transformed_object_file_path: str = os.path.join(
-        data_transformation_dir,
-        DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR,
-        PREPROCSSING_OBJECT_FILE_NAME
-    )
+    data_transformation_dir: str = _stage_dir(DATA_TRANSFORMATION_DIR_NAME)
+    transformed_train_file_path: Optional[str] = None
+    transformed_test_file_path: Optional[str] = None
+    transformed_object_file_path: Optional[str] = None
+
+    def __post_init__(self):
+        _set_default_path(
+            self, "transformed_train_file_path",
+            self.data_transformation_dir,
+            DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
+            os.path.splitext(TRAIN_FILE_NAME)[0] + ".npy"
+        )
+        _set_default_path(
+            self, "transformed_test_file_path",
+            self.data_transformation_dir,
+            DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR,
+            os.path.splitext(TEST_FILE_NAME)[0] + ".npy"
+        )
+        _set_default_path(
+            self, "transformed_object_file_path",
+            self.data_transformation_dir,
+            DATA_TRANSFORMATION_TRANSFORMED_OBJECT_DIR,
+            PREPROCSSING_OBJECT_FILE_NAME
+        )
 
 # ========================================================================================
 # MODEL TRAINER CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelTrainerConfig:
     """
     Configuration for model training stage.
     Specifies model storage, training hyperparameters, and model config path.
     """
-    model_trainer_dir: str = os.path.join(training_pipeline_config.artifact_dir, MODEL_TRAINER_DIR_NAME)
-    trained_model_file_path: str = os.path.join(
-        model_trainer_dir,
-        MODEL_TRAINER_TRAINED_MODEL_DIR,
-        MODEL_FILE_NAME
-    )
+    model_trainer_dir: str = _stage_dir(MODEL_TRAINER_DIR_NAME)
+    trained_model_file_path: Optional[str] = None
     expected_accuracy: float = MODEL_TRAINER_EXPECTED_SCORE
     model_config_file_path: str = MODEL_TRAINER_MODEL_CONFIG_FILE_PATH
 
@@ -110,11 +169,19 @@ class ModelTrainerConfig:
     _criterion = MIN_SAMPLES_SPLIT_CRITERION
     _random_state = MIN_SAMPLES_SPLIT_RANDOM_STATE
 
+    def __post_init__(self):
+        _set_default_path(
+            self, "trained_model_file_path",
+            self.model_trainer_dir,
+            MODEL_TRAINER_TRAINED_MODEL_DIR,
+            MODEL_FILE_NAME
+        )
+
 # ========================================================================================
 # MODEL EVALUATION CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelEvaluationConfig:
     """
     Configuration for model evaluation stage.
@@ -128,7 +195,7 @@ class ModelEvaluationConfig:
 # MODEL PUSHER CONFIGURATION
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelPusherConfig:
     """
     Configuration for model deployment (pushing to S3 or model registry).
@@ -140,7 +207,7 @@ class ModelPusherConfig:
 # VEHICLE PREDICTION CONFIGURATION (for inference use case)
 # ========================================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VehiclePredictorConfig:
     """
     Configuration for loading model from S3 or local storage for making predictions.
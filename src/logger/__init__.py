@@ -1,6 +1,8 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from from_root import from_root
 from datetime import datetime
 
@@ -15,9 +17,23 @@ log_dir_path = os.path.join(from_root(), LOG_DIR)
 os.makedirs(log_dir_path, exist_ok=True)
 log_file_path = os.path.join(log_dir_path, LOG_FILE)
 
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues the record untouched. The stdlib prepare() formats the message
+    on the logging thread; here the QueueListener's handlers format it instead, and only when
+    their level accepts the record. Log arguments must therefore not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def configure_logger():
     """
     Configures logging with a rotating file handler and a console handler.
+
+    Both handlers sit behind a DeferredFormatQueueHandler: the logging call only enqueues the
+    record and a background QueueListener thread does the formatting, writing and flushing.
     """
     # Create a custom logger
     logger = logging.getLogger()
@@ -36,9 +52,15 @@ def configure_logger():
     console_handler.setFormatter(formatter)
     console_handler.setLevel(logging.INFO)
     
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue so callers never block on file/console I/O;
+    # respect_handler_level keeps the per-handler levels set above
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    logger.addHandler(DeferredFormatQueueHandler(log_queue))
+    listener.start()
+
+    # Drain pending records before the interpreter exits
+    atexit.register(listener.stop)
 
 # Configure the logger
 configure_logger()
\ No newline at end of file
@@ -1,6 +1,11 @@
 # Importing system module for handling system-specific parameters and functions
 import sys
 
+# Importing asyncio to overlap the s3 model download with the local pipeline stages
+import asyncio
+from functools import cached_property, lru_cache
+from typing import Optional, Tuple
+
 # Importing custom exception class for consistent error handling
 from src.exception import MyException
 
@@ -14,9 +19,12 @@ from src.components.data_transformation import DataTransformation
 from src.components.model_trainer import ModelTrainer
 from src.components.model_evaluation import ModelEvaluation
 from src.components.model_pusher import ModelPusher
+from src.entity.s3_estimator import Proj1Estimator
+from src.utils.main_utils import wait_for_pending_writes
 
 # Importing configuration classes for each pipeline stage
 from src.entity.config_entity import (
+    get_timestamp,              # Timestamp of the current run
     DataIngestionConfig,        # Configuration for data ingestion
     DataValidationConfig,       # Configuration for data validation
     DataTransformationConfig,   # Configuration for data transformation
@@ -36,34 +44,53 @@ from src.entity.artifact_entity import (
 )
 
 
+@lru_cache(maxsize=None)
+def _shared_config(config_cls: type, timestamp: str):
+    """
+    Builds one config_cls instance per run timestamp, so all TrainPipeline objects of a run
+    (e.g. in a tuning loop) share it. Configs are frozen dataclasses, so sharing is safe.
+    """
+    return config_cls()
+
+
 class TrainPipeline:
     """
     Orchestrates the complete machine learning training pipeline from data ingestion to model deployment.
-    Manages the sequential execution of all pipeline components.
+    Stages run in order on worker threads, while the production model is fetched from s3 alongside them.
     """
 
-    def __init__(self):
-        """
-        Initializes the training pipeline by creating configuration objects for each stage.
-        Each configuration contains parameters specific to that pipeline component.
-        """
-        # Initialize data ingestion configuration
-        self.data_ingestion_config = DataIngestionConfig()
-        
-        # Initialize data validation configuration
-        self.data_validation_config = DataValidationConfig()
-        
-        # Initialize data transformation configuration
-        self.data_transformation_config = DataTransformationConfig()
-        
-        # Initialize model training configuration
-        self.model_trainer_config = ModelTrainerConfig()
-        
-        # Initialize model evaluation configuration
-        self.model_evaluation_config = ModelEvaluationConfig()
-        
-        # Initialize model deployment configuration
-        self.model_pusher_config = ModelPusherConfig()
+    # Each stage's configuration is built on first use only (a trainer-only rerun never builds the
+    # ingestion config) and is shared by every TrainPipeline of the same run, see _shared_config
+
+    @cached_property
+    def data_ingestion_config(self) -> DataIngestionConfig:
+        """Configuration for data ingestion."""
+        return _shared_config(DataIngestionConfig, get_timestamp())
+
+    @cached_property
+    def data_validation_config(self) -> DataValidationConfig:
+        """Configuration for data validation."""
+        return _shared_config(DataValidationConfig, get_timestamp())
+
+    @cached_property
+    def data_transformation_config(self) -> DataTransformationConfig:
+        """Configuration for data transformation."""
+        return _shared_config(DataTransformationConfig, get_timestamp())
+
+    @cached_property
+    def model_trainer_config(self) -> ModelTrainerConfig:
+        """Configuration for model training."""
+        return _shared_config(ModelTrainerConfig, get_timestamp())
+
+    @cached_property
+    def model_evaluation_config(self) -> ModelEvaluationConfig:
+        """Configuration for model evaluation."""
+        return _shared_config(ModelEvaluationConfig, get_timestamp())
+
+    @cached_property
+    def model_pusher_config(self) -> ModelPusherConfig:
+        """Configuration for model deployment."""
+        return _shared_config(ModelPusherConfig, get_timestamp())
 
     def start_data_ingestion(self) -> DataIngestionArtifact:
         """
@@ -160,6 +187,54 @@ class TrainPipeline:
             # Convert any exceptions to custom exception format
             raise MyException(e, sys)
         
+    def start_data_validation_and_transformation(
+            self, data_ingestion_artifact: DataIngestionArtifact
+    ) -> Tuple[DataValidationArtifact, DataTransformationArtifact]:
+        """
+        Executes data validation and data transformation over a single read of the train/test files.
+        Both components receive the same DataFrames instead of each loading them from disk.
+        Args:
+            data_ingestion_artifact: Contains paths to the ingested data
+        Returns:
+            Tuple of DataValidationArtifact and DataTransformationArtifact
+        """
+        logging.info("Entered the start_data_validation_and_transformation method of TrainPipeline class")
+
+        try:
+            # Set up validation (reads the schema) first; only then wait for ingestion's background writes
+            data_validation = DataValidation(
+                data_ingestion_artifact=data_ingestion_artifact,
+                data_validation_config=self.data_validation_config
+            )
+
+            # Read train and test data once for both stages, as soon as the files are written
+            wait_for_pending_writes(data_ingestion_artifact.pending_writes)
+            train_df = DataValidation.read_data(file_path=data_ingestion_artifact.trained_file_path)
+            test_df = DataValidation.read_data(file_path=data_ingestion_artifact.test_file_path)
+
+            # Validate the loaded data
+            data_validation_artifact = data_validation.initiate_data_validation(train_df=train_df, test_df=test_df)
+            logging.info("Performed the data validation operation")
+
+            # Transform the same data; fails with the validation message if validation did not pass
+            data_transformation = DataTransformation(
+                data_ingestion_artifact=data_ingestion_artifact,
+                data_transformation_config=self.data_transformation_config,
+                data_validation_artifact=data_validation_artifact
+            )
+            data_transformation_artifact = data_transformation.initiate_data_transformation(
+                train_df=train_df, test_df=test_df
+            )
+
+            logging.info("Exited the start_data_validation_and_transformation method of TrainPipeline class")
+
+            # Return both results
+            return data_validation_artifact, data_transformation_artifact
+
+        except Exception as e:
+            # Convert any exceptions to custom exception format
+            raise MyException(e, sys) from e
+
     def start_model_trainer(self, data_transformation_artifact: DataTransformationArtifact) -> ModelTrainerArtifact:
         """
         Executes the model training component of the pipeline.
@@ -185,14 +260,39 @@ class TrainPipeline:
             # Convert any exceptions to custom exception format
             raise MyException(e, sys)
 
+    def fetch_production_model(self) -> Optional[Proj1Estimator]:
+        """
+        Downloads and loads the production model from s3, if there is one.
+        Meant to run while the local stages are busy; any failure is logged and None is
+        returned, so model evaluation falls back to fetching the model itself.
+        Returns:
+            Proj1Estimator with the model loaded, or None
+        """
+        try:
+            model_path = self.model_evaluation_config.s3_model_key_path
+            best_model = Proj1Estimator(bucket_name=self.model_evaluation_config.bucket_name, model_path=model_path)
+            if not best_model.is_model_present(model_path=model_path):
+                return None
+
+            # Load now so evaluation does not pay for the download
+            best_model.loaded_model = best_model.load_model()
+            logging.info("Prefetched production model from s3")
+            return best_model
+
+        except Exception as e:
+            logging.warning("Could not prefetch production model, evaluation will fetch it: %s", e)
+            return None
+
     def start_model_evaluation(self, 
                              data_ingestion_artifact: DataIngestionArtifact,
-                             model_trainer_artifact: ModelTrainerArtifact) -> ModelEvaluationArtifact:
+                             model_trainer_artifact: ModelTrainerArtifact,
+                             best_model: Optional[Proj1Estimator] = None) -> ModelEvaluationArtifact:
         """
         Executes the model evaluation component of the pipeline.
         Args:
             data_ingestion_artifact: Contains reference to test data
             model_trainer_artifact: Contains trained model to evaluate
+            best_model: Production model fetched ahead of time, if any
         Returns:
             ModelEvaluationArtifact: Contains evaluation metrics and acceptance status
         """
@@ -201,7 +301,8 @@ class TrainPipeline:
             model_evaluation = ModelEvaluation(
                 model_eval_config=self.model_evaluation_config,
                 data_ingestion_artifact=data_ingestion_artifact,
-                model_trainer_artifact=model_trainer_artifact
+                model_trainer_artifact=model_trainer_artifact,
+                best_model=best_model
             )
             
             # Execute model evaluation process and get results
@@ -241,38 +342,47 @@ class TrainPipeline:
 
     def run_pipeline(self) -> None:
         """
-        Executes the complete training pipeline in sequence.
-        Handles the flow between components and manages the overall process.
+        Executes the complete training pipeline.
+        Blocking wrapper around run_pipeline_async for callers without a running event loop.
+        """
+        asyncio.run(self.run_pipeline_async())
+
+    async def run_pipeline_async(self) -> None:
+        """
+        Executes the complete training pipeline.
+        Each stage depends on the previous one, so stages run in order, each on a worker thread
+        (keeping an enclosing event loop responsive). The production model download from s3
+        only depends on configuration, so it starts right away and overlaps the local stages.
         """
+        # Start pulling the production model while data is ingested, transformed and trained on
+        best_model_task = asyncio.create_task(asyncio.to_thread(self.fetch_production_model))
+
         try:
             # Log start of data ingestion and execute
             logging.info("Starting data ingestion...")
-            data_ingestion_artifact = self.start_data_ingestion()
+            data_ingestion_artifact = await asyncio.to_thread(self.start_data_ingestion)
             
-            # Log start of data validation and execute with ingestion results
-            logging.info("Starting data validation...")
-            data_validation_artifact = self.start_data_validation(
+            # Log start of data validation and transformation and execute both over one read of the data
+            logging.info("Starting data validation and transformation...")
+            data_validation_artifact, data_transformation_artifact = await asyncio.to_thread(
+                self.start_data_validation_and_transformation,
                 data_ingestion_artifact=data_ingestion_artifact
             )
             
-            # Log start of data transformation and execute with previous results
-            logging.info("Starting data transformation...")
-            data_transformation_artifact = self.start_data_transformation(
-                data_ingestion_artifact=data_ingestion_artifact, 
-                data_validation_artifact=data_validation_artifact
-            )
-            
             # Log start of model training and execute with transformation results
             logging.info("Starting model training...")
-            model_trainer_artifact = self.start_model_trainer(
+            model_trainer_artifact = await asyncio.to_thread(
+                self.start_model_trainer,
                 data_transformation_artifact=data_transformation_artifact
             )
             
             # Log start of model evaluation and execute with previous results
             logging.info("Starting model evaluation...")
-            model_evaluation_artifact = self.start_model_evaluation(
+            model_evaluation_artifact = await asyncio.to_thread(
+                self.start_model_evaluation,
                 data_ingestion_artifact=data_ingestion_artifact,
-                model_trainer_artifact=model_trainer_artifact
+                model_trainer_artifact=model_trainer_artifact,
+                best_model=await best_model_task
             )
             
             # Check if model was accepted in evaluation
@@ -283,7 +393,8 @@ class TrainPipeline:
                 
             # Log start of model deployment and execute with evaluation results
             logging.info("Starting model pushing...")
-            model_pusher_artifact = self.start_model_pusher(
+            model_pusher_artifact = await asyncio.to_thread(
+                self.start_model_pusher,
                 model_evaluation_artifact=model_evaluation_artifact
             )
             
@@ -292,7 +403,11 @@ class TrainPipeline:
             
         except Exception as e:
             # Log any errors during pipeline execution
-            logging.error(f"Error in pipeline execution: {str(e)}")
+            logging.error("Error in pipeline execution: %s", e)
             
             # Convert to custom exception format
-            raise MyException(e, sys)
\ No newline at end of file
+            raise MyException(e, sys)
+
+        finally:
+            # Drop the prefetch if an earlier stage failed before it was needed
+            best_model_task.cancel()
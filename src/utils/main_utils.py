@@ -1,9 +1,13 @@
 import os
 import sys
 
+from concurrent.futures import Future
+from typing import Iterable
+
 import numpy as np
 import dill
 import yaml
+import pandas as pd
 from pandas import DataFrame
 
 from src.exception import MyException
@@ -72,6 +76,44 @@ def load_numpy_array_data(file_path: str) -> np.array:
         raise MyException(e, sys) from e
 
 
+def optimize_dtypes(df: DataFrame, category_max_unique_ratio: float = 0.5) -> DataFrame:
+    """
+    Downcast integer columns to the smallest dtype holding their values, float columns to
+    float32 only when that is lossless, and convert low-cardinality text columns to 'category'.
+    df: pandas DataFrame, modified in place and returned
+    category_max_unique_ratio: text columns with fewer distinct values than this share of rows become 'category'
+    return: DataFrame with optimized dtypes
+    """
+    try:
+        for column in df.columns:
+            values = df[column]
+            if pd.api.types.is_integer_dtype(values):
+                df[column] = pd.to_numeric(values, downcast="integer")
+            elif pd.api.types.is_float_dtype(values):
+                # Only when every value survives float32 exactly, so training sees the same numbers as prediction
+                float32_values = values.astype("float32")
+                if float32_values.astype(values.dtype).equals(values):
+                    df[column] = float32_values
+            elif pd.api.types.is_string_dtype(values) and values.nunique() < category_max_unique_ratio * len(values):
+                df[column] = values.astype("category")
+        return df
+    except Exception as e:
+        raise MyException(e, sys) from e
+
+
+def wait_for_pending_writes(pending_writes: Iterable[Future]) -> None:
+    """
+    Block until background file writes have finished.
+    pending_writes: futures of the writes, e.g. DataIngestionArtifact.pending_writes
+    raises: the first write error, wrapped in MyException
+    """
+    try:
+        for pending_write in pending_writes:
+            pending_write.result()
+    except Exception as e:
+        raise MyException(e, sys) from e
+
+
 def save_object(file_path: str, obj: object) -> None:
     logging.info("Entered the save_object method of utils")
 
@@ -0,0 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import src.entity.config_entity as config_entity
+
+
+def test_get_timestamp_is_shared_by_concurrent_first_calls(monkeypatch):
+    monkeypatch.setattr(config_entity, "_timestamp", None)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        timestamps = set(executor.map(lambda _: config_entity.get_timestamp(), range(64)))
+
+    assert len(timestamps) == 1
@@ -0,0 +1,128 @@
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.components.data_ingestion as data_ingestion_module
+from src.components.data_ingestion import DataIngestion
+from src.entity.config_entity import DataIngestionConfig
+from src.utils.main_utils import wait_for_pending_writes
+
+
+@pytest.fixture
+def config(tmp_path):
+    return DataIngestionConfig(
+        data_ingestion_dir=str(tmp_path / "data_ingestion"),
+        feature_store_cache_dir=str(tmp_path / "feature_store_cache"),
+        random_state=42,
+    )
+
+
+def make_dataframe(n_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"id": np.arange(n_rows), "Response": (rng.random(n_rows) < 0.12).astype(int)})
+
+
+def split(config: DataIngestionConfig, dataframe: pd.DataFrame):
+    data_ingestion = DataIngestion(config)
+    data_ingestion.split_data_as_train_test(dataframe).result()
+    data_ingestion._writer.shutdown(wait=True)
+    return pd.read_feather(config.training_file_path), pd.read_feather(config.testing_file_path)
+
+
+@pytest.mark.parametrize("n_rows", [1, 4, 101, 10_000])
+def test_split_sizes_follow_ratio_rounded_up(config, n_rows):
+    train_df, test_df = split(config, make_dataframe(n_rows))
+
+    n_test = math.ceil(n_rows * config.train_test_split_ratio)
+    assert len(test_df) == n_test
+    assert len(train_df) == n_rows - n_test
+
+
+def test_split_is_a_partition_and_reproducible(config):
+    dataframe = make_dataframe(1_000)
+
+    train_df, test_df = split(config, dataframe)
+    train_again, test_again = split(config, dataframe)
+
+    assert set(train_df["id"]).isdisjoint(test_df["id"])
+    assert sorted(train_df["id"].tolist() + test_df["id"].tolist()) == dataframe["id"].tolist()
+    pd.testing.assert_frame_equal(test_df, test_again)
+    pd.testing.assert_frame_equal(train_df, train_again)
+
+
+def test_split_keeps_target_share_close_to_the_full_data(config):
+    dataframe = make_dataframe(10_000)
+
+    train_df, test_df = split(config, dataframe)
+
+    # The split is random, not stratified; on this size both sides stay close to the overall share
+    overall_share = dataframe["Response"].mean()
+    assert abs(train_df["Response"].mean() - overall_share) < 0.02
+    assert abs(test_df["Response"].mean() - overall_share) < 0.02
+
+
+class FakeProj1Data:
+    """Stands in for the MongoDB access class: fixed fingerprint, exports a small frame."""
+    exports = 0
+
+    def get_collection_fingerprint(self, collection_name, database_name=None):
+        return "fingerprint"
+
+    def export_collection_as_dataframe(self, collection_name, database_name=None, file_path=None):
+        FakeProj1Data.exports += 1
+        dataframe = make_dataframe(20)
+        dataframe.to_parquet(file_path, index=False)
+        return dataframe
+
+
+@pytest.fixture
+def fake_proj1_data(monkeypatch):
+    FakeProj1Data.exports = 0
+    monkeypatch.setattr(data_ingestion_module, "Proj1Data", FakeProj1Data)
+
+
+def ingest(config: DataIngestionConfig):
+    data_ingestion = DataIngestion(config)
+    artifact = data_ingestion.initiate_data_ingestion()
+    data_ingestion._writer.shutdown(wait=True)  # Let the background copies finish too
+    return artifact
+
+
+def test_feature_store_cache_miss_then_hit(fake_proj1_data, config, tmp_path):
+    ingest(config)
+    assert FakeProj1Data.exports == 1
+    assert (tmp_path / "feature_store_cache" / "fingerprint.parquet").exists()
+
+    # A second run with the same fingerprint reuses the cached export instead of querying MongoDB
+    second_config = DataIngestionConfig(
+        data_ingestion_dir=str(tmp_path / "second_run"),
+        feature_store_cache_dir=config.feature_store_cache_dir,
+    )
+    artifact = ingest(second_config)
+
+    assert FakeProj1Data.exports == 1
+    pd.testing.assert_frame_equal(pd.read_parquet(second_config.feature_store_file_path), make_dataframe(20))
+    assert len(pd.read_feather(artifact.trained_file_path)) + len(pd.read_feather(artifact.test_file_path)) == 20
+
+
+def test_artifact_waits_only_on_train_test_write(fake_proj1_data, config, monkeypatch):
+    copy_started = threading.Event()
+    release_copy = threading.Event()
+
+    def blocking_copy(*paths):
+        copy_started.set()
+        release_copy.wait(timeout=5)
+
+    monkeypatch.setattr(DataIngestion, "_populate_cache", staticmethod(blocking_copy))
+    data_ingestion = DataIngestion(config)
+    artifact = data_ingestion.initiate_data_ingestion()
+
+    # The train/test files are ready while the cache copy is still running behind them
+    wait_for_pending_writes(artifact.pending_writes)
+    assert copy_started.wait(timeout=5)
+    assert len(pd.read_feather(artifact.test_file_path)) == math.ceil(20 * config.train_test_split_ratio)
+    release_copy.set()
+    data_ingestion._writer.shutdown(wait=True)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.main_utils import optimize_dtypes
+
+
+def test_optimize_dtypes_downcasts_integers_without_changing_values():
+    df = pd.DataFrame({"small": [0, 1, 120], "large": [0, 40_000, 2_000_000]})
+    original = df.copy()
+
+    optimized = optimize_dtypes(df)
+
+    assert optimized["small"].dtype == np.int8
+    assert optimized["large"].dtype == np.int32
+    pd.testing.assert_frame_equal(optimized, original, check_dtype=False)
+
+
+def test_optimize_dtypes_keeps_float64_when_float32_would_round():
+    df = pd.DataFrame({"premium": [40454.37, 33536.11, 0.1]})
+
+    optimized = optimize_dtypes(df)
+
+    assert optimized["premium"].dtype == np.float64
+    assert optimized["premium"].tolist() == [40454.37, 33536.11, 0.1]
+
+
+def test_optimize_dtypes_downcasts_floats_that_round_trip_exactly():
+    df = pd.DataFrame({"code": [28.0, 3.0, np.nan, 0.5]})
+
+    optimized = optimize_dtypes(df)
+
+    assert optimized["code"].dtype == np.float32
+    pd.testing.assert_series_equal(optimized["code"].astype("float64"), pd.Series([28.0, 3.0, np.nan, 0.5], name="code"))
+
+
+@pytest.mark.parametrize("values, expected_category", [
+    (["Male", "Female"] * 50, True),                 # 2 distinct values in 100 rows
+    ([f"id_{i}" for i in range(100)], False),        # every value distinct
+])
+def test_optimize_dtypes_converts_only_low_cardinality_text(values, expected_category):
+    optimized = optimize_dtypes(pd.DataFrame({"text": values}))
+
+    assert isinstance(optimized["text"].dtype, pd.CategoricalDtype) is expected_category
+    assert optimized["text"].astype(object).tolist() == values
+
+
+def test_wait_for_pending_writes_returns_once_writes_are_done():
+    from concurrent.futures import ThreadPoolExecutor
+    from src.utils.main_utils import wait_for_pending_writes
+
+    written = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_writes = [executor.submit(written.append, n) for n in range(3)]
+        wait_for_pending_writes(pending_writes)
+
+    assert written == [0, 1, 2]
+
+
+def test_wait_for_pending_writes_reraises_write_errors():
+    from concurrent.futures import Future
+    from src.exception import MyException
+    from src.utils.main_utils import wait_for_pending_writes
+
+    failed_write = Future()
+    failed_write.set_exception(OSError("disk full"))
+
+    with pytest.raises(MyException, match="disk full"):
+        wait_for_pending_writes([failed_write])
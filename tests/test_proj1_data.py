@@ -0,0 +1,117 @@
+import bson
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import src.data_access.proj1_data as proj1_data_module
+from src.data_access.proj1_data import Proj1Data
+
+
+@pytest.fixture
+def proj1_data(monkeypatch):
+    # No MongoDB here: only the schema-driven decoding is exercised
+    monkeypatch.setattr(proj1_data_module, "get_mongodb_client", lambda database_name: None)
+    return Proj1Data()
+
+
+def make_document(i: int, **overrides) -> dict:
+    document = {
+        "id": i, "Gender": "Male", "Age": 30 + i, "Driving_License": 1, "Region_Code": 28.0,
+        "Previously_Insured": 0, "Vehicle_Age": "> 2 Years", "Vehicle_Damage": "Yes",
+        "Annual_Premium": 40454.5, "Policy_Sales_Channel": 26.0, "Vintage": 217, "Response": 1,
+    }
+    document.update(overrides)
+    return document
+
+
+def raw_batch(*documents: dict) -> bytes:
+    return b"".join(bson.encode(document) for document in documents)
+
+
+class FakeRawBatchCursor:
+    """Iterable of raw BSON batches that, like a PyMongo cursor, is closed through its context manager."""
+
+    def __init__(self, *batches: bytes):
+        self.batches = batches
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self.batches)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+
+def test_decode_raw_batch_follows_schema(proj1_data):
+    table = proj1_data._decode_raw_batch(raw_batch(make_document(1), make_document(2, Gender="Female")))
+
+    assert table.schema == proj1_data.arrow_schema
+    assert table.schema.field("Age").type == pa.int64()
+    assert table.schema.field("Annual_Premium").type == pa.float64()
+    assert table.schema.field("Gender").type == pa.string()
+    assert table.column("Gender").to_pylist() == ["Male", "Female"]
+    assert table.column("id").to_pylist() == [1, 2]
+
+
+def test_decode_raw_batch_turns_na_sentinel_into_nulls(proj1_data):
+    table = proj1_data._decode_raw_batch(raw_batch(
+        make_document(1, Vehicle_Damage="na", Annual_Premium="na", Age="na"),
+        make_document(2),
+    ))
+
+    assert table.column("Vehicle_Damage").to_pylist() == [None, "Yes"]
+    assert table.column("Annual_Premium").to_pylist() == [None, 40454.5]
+    assert table.column("Age").to_pylist() == [None, 32]
+
+
+def test_decode_raw_batch_fills_missing_fields_with_nulls(proj1_data):
+    document = make_document(1)
+    del document["Vintage"]
+
+    table = proj1_data._decode_raw_batch(raw_batch(document))
+
+    assert table.column("Vintage").to_pylist() == [None]
+
+
+def test_write_raw_batches_streams_every_batch_to_feather(proj1_data, tmp_path):
+    file_path = str(tmp_path / "train.feather")
+    cursor = FakeRawBatchCursor(raw_batch(make_document(1), make_document(2)), raw_batch(make_document(3)))
+
+    n_rows = proj1_data._write_raw_batches(cursor, file_path)
+
+    assert n_rows == 3
+    assert cursor.closed
+    assert pd.read_feather(file_path)["id"].tolist() == [1, 2, 3]
+
+
+def test_server_side_split_files_get_in_memory_split_dtypes(proj1_data, tmp_path):
+    from src.components.data_ingestion import DataIngestion
+    from src.entity.config_entity import DataIngestionConfig
+    from src.utils.main_utils import optimize_dtypes
+
+    rng = np.random.default_rng(0)
+    documents = [
+        make_document(i, Gender=str(rng.choice(["Male", "Female"])), Annual_Premium=float(rng.random() * 1e4))
+        for i in range(200)
+    ]
+    config = DataIngestionConfig(data_ingestion_dir=str(tmp_path), random_state=0)
+    (tmp_path / "ingested").mkdir()
+
+    # In-memory path: whole export optimized, then split
+    full_frame = optimize_dtypes(proj1_data._decode_raw_batch(raw_batch(*documents)).to_pandas())
+    data_ingestion = DataIngestion(config)
+    data_ingestion.split_data_as_train_test(full_frame).result()
+    expected_dtypes = pd.read_feather(config.training_file_path).dtypes
+
+    # Server-side path: raw batches streamed per split, then dtypes fixed up afterwards
+    proj1_data._write_raw_batches(FakeRawBatchCursor(raw_batch(*documents[:150])), config.training_file_path)
+    proj1_data._write_raw_batches(FakeRawBatchCursor(raw_batch(*documents[150:])), config.testing_file_path)
+    data_ingestion._optimize_split_dtypes()
+    data_ingestion._writer.shutdown(wait=True)
+
+    pd.testing.assert_series_equal(pd.read_feather(config.training_file_path).dtypes, expected_dtypes)
+    pd.testing.assert_series_equal(pd.read_feather(config.testing_file_path).dtypes, expected_dtypes)
@@ -0,0 +1,76 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+# The pipeline module imports every component, including sklearn/imblearn models and the boto3 S3 client
+pytest.importorskip("sklearn")
+pytest.importorskip("imblearn")
+pytest.importorskip("boto3")
+
+from src.exception import MyException
+from src.pipline.training_pipeline import TrainPipeline
+
+
+@pytest.fixture
+def pipeline():
+    """TrainPipeline whose stages only record the order they ran in."""
+    pipeline = TrainPipeline()
+    pipeline.calls = []
+    pipeline.kwargs = {}
+    pipeline.prefetch_done = threading.Event()
+
+    def fetch_production_model():
+        pipeline.calls.append("fetch_production_model")
+        pipeline.prefetch_done.set()
+        return "production_model"
+
+    def stage(name, result):
+        def run(**kwargs):
+            pipeline.calls.append(name)
+            pipeline.kwargs[name] = kwargs
+            return result
+        return run
+
+    pipeline.fetch_production_model = fetch_production_model
+    pipeline.start_data_ingestion = stage("ingestion", "ingestion_artifact")
+    pipeline.start_data_validation_and_transformation = stage(
+        "validation_and_transformation", ("validation_artifact", "transformation_artifact")
+    )
+    pipeline.start_model_trainer = stage("trainer", "trainer_artifact")
+    pipeline.start_model_evaluation = stage("evaluation", SimpleNamespace(is_model_accepted=True))
+    pipeline.start_model_pusher = stage("pusher", "pusher_artifact")
+    return pipeline
+
+
+def test_stages_run_in_order_with_prefetched_model(pipeline):
+    pipeline.run_pipeline()
+
+    local_stages = [call for call in pipeline.calls if call != "fetch_production_model"]
+    assert local_stages == ["ingestion", "validation_and_transformation", "trainer", "evaluation", "pusher"]
+    assert pipeline.calls.index("fetch_production_model") < pipeline.calls.index("evaluation")
+    assert pipeline.kwargs["evaluation"] == {
+        "data_ingestion_artifact": "ingestion_artifact",
+        "model_trainer_artifact": "trainer_artifact",
+        "best_model": "production_model",
+    }
+    assert pipeline.kwargs["trainer"] == {"data_transformation_artifact": "transformation_artifact"}
+
+
+def test_rejected_model_is_not_pushed(pipeline):
+    pipeline.start_model_evaluation = lambda **kwargs: SimpleNamespace(is_model_accepted=False)
+
+    pipeline.run_pipeline()
+
+    assert "pusher" not in pipeline.calls
+
+
+def test_stage_failure_stops_pipeline(pipeline):
+    def failing_ingestion():
+        raise RuntimeError("mongo unreachable")
+
+    pipeline.start_data_ingestion = failing_ingestion
+
+    with pytest.raises(MyException, match="mongo unreachable"):
+        pipeline.run_pipeline()
+    assert "validation_and_transformation" not in pipeline.calls